@@ -13,7 +13,7 @@ from .provider.dify_provider import DifyProvider
 from .provider.topia_orch_provider import TopiaOrchProvider
 from .chat_manager import ChatManager
 from bot.models import BotConfig
-from config import bot_service
+from config import bot_service, config
 
 class ChatApp:
     def __init__(self, bot_config: Optional[BotConfig] = None, chat_id: Optional[str] = None, verbose: bool = False):
@@ -34,7 +34,7 @@ class ChatApp:
         # Initialize managers
         display_manager = DisplayManager(bot_config)
         input_manager = InputManager(display_manager.console)
-        mcp_manager = MCPManager(display_manager.console)
+        mcp_manager = MCPManager(display_manager.console, catalog_file=config.get('mcp_catalog_file'))
         # Create provider based on api_type
         provider: BaseProvider
         if bot_config.api_type == "dify":
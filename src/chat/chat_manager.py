@@ -1,4 +1,8 @@
-from typing import List, Dict, Optional
+import asyncio
+import time
+import orjson
+from collections import OrderedDict
+from typing import Any, List, Dict, Optional
 from contextlib import AsyncExitStack
 from types import SimpleNamespace
 
@@ -10,7 +14,7 @@ from cli.input_manager import InputManager
 from mcp_server.mcp_manager import MCPManager
 from prompt.preset import time_prompt
 from util import generate_id
-from .utils.tool_utils import contains_tool_use, split_content
+from .utils.tool_utils import TOOL_SENTINEL, contains_tool_use, split_content
 from .utils.message_utils import create_message
 from .provider.base_provider import BaseProvider
 from bot import BotConfig
@@ -18,6 +22,9 @@ from config import prompt_service, mcp_service
 from config import config
 from loguru import logger
 
+# Seconds to wait for further changes before writing the chat
+_PERSIST_DEBOUNCE = 0.25
+
 class ChatManager:
     def __init__(
         self,
@@ -62,6 +69,33 @@ class ChatManager:
         self.chat_id: Optional[str] = None
         self.continue_exist = False
         self.last_printed_text_output: Optional[str] = None # Track last text output
+        self.last_assistant_index: Optional[int] = None # Index of last assistant message in self.messages
+        self._messages_summary: List[str] = [] # "[index] role" line per message, for copy-by-index errors
+
+        # Background chat persistence state
+        self._persist_dirty = asyncio.Event()
+        self._persist_lock = asyncio.Lock()
+        self._persist_task: Optional[asyncio.Task] = None
+
+        # Slash command dispatch table (canonical command -> handler)
+        self._command_handlers = {
+            '/copy': self._handle_copy_command,
+            '/translate': self._handle_translate_command,
+            '/save': self._handle_save_command,
+        }
+
+        # Per-server auto-confirm tools and tool result cache TTLs, resolved once
+        self._auto_confirm: Dict[str, frozenset] = {}
+        self._tool_cache_ttls: Dict[str, int] = {}
+        for server_name in (self.bot_config.mcp_servers or ()):
+            server_config = mcp_service.get_config(server_name)
+            if server_config:
+                self._auto_confirm[server_name] = frozenset(server_config.auto_confirm or ())
+                self._tool_cache_ttls[server_name] = server_config.cache_ttl or 0
+
+        # LRU cache of tool results keyed by (server, tool, canonical arguments)
+        self._tool_cache: "OrderedDict[tuple, tuple[float, Any]]" = OrderedDict()
+        self._tool_cache_max = 256
 
         # Generate new chat ID immediately
         if chat_id:
@@ -79,11 +113,67 @@ class ChatManager:
 
         self.messages = existing_chat.messages
         self.current_chat = existing_chat
+        self.external_id = existing_chat.external_id
+        self.last_assistant_index = next(
+            (i for i in range(len(self.messages) - 1, -1, -1) if self.messages[i].role == 'assistant'),
+            None
+        )
 
         if self.verbose:
             logger.info(f"Loaded {len(self.messages)} messages from chat {chat_id}")
 
-    def get_user_confirmation(self, content: str, server_name: str = None, tool_name: str = None) -> bool:
+    @staticmethod
+    def _tool_cache_key(server_name: str, tool_name: str, arguments: dict) -> Optional[tuple]:
+        """Build a cache key for a tool call with canonicalized arguments, or None if they can't be serialized"""
+        try:
+            return (server_name, tool_name, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS).decode('utf-8'))
+        except TypeError:
+            return None
+
+    @staticmethod
+    def _is_cacheable_result(tool_results: Any) -> bool:
+        """Check whether a tool result may be cached (no errors, no 'no-cache' hint)"""
+        if isinstance(tool_results, str):
+            if tool_results.startswith(("Error executing MCP tool:", "Error communicating with daemon:")):
+                return False
+            try:
+                tool_results = orjson.loads(tool_results)
+            except orjson.JSONDecodeError:
+                return True
+        if isinstance(tool_results, dict):
+            meta = tool_results.get("_meta")
+            if isinstance(meta, dict) and meta.get("cache_hint") == "no-cache":
+                return False
+        return True
+
+    def _get_tool_cache_ttl(self, server_name: str) -> int:
+        """Get the tool result cache TTL (seconds) configured for a server"""
+        return self._tool_cache_ttls.get(server_name, 0)
+
+    def _get_cached_tool_result(self, key: tuple, ttl: int) -> Optional[Any]:
+        """Return a cached tool result if present and not expired"""
+        if ttl <= 0:
+            return None
+        entry = self._tool_cache.get(key)
+        if entry is None:
+            return None
+        cached_at, tool_results = entry
+        if time.monotonic() - cached_at >= ttl:
+            del self._tool_cache[key]
+            return None
+        self._tool_cache.move_to_end(key)
+        return tool_results
+
+    def _store_tool_result(self, key: tuple, tool_results: Any):
+        """Store a tool result in the cache, evicting the least recently used entry"""
+        if not self._is_cacheable_result(tool_results):
+            return
+        self._tool_cache[key] = (time.monotonic(), tool_results)
+        self._tool_cache.move_to_end(key)
+        if len(self._tool_cache) > self._tool_cache_max:
+            self._tool_cache.popitem(last=False)
+
+    async def get_user_confirmation(self, content: str, server_name: str = None, tool_name: str = None) -> bool:
         """Get user confirmation before executing tool use
 
         Args:
@@ -95,53 +185,78 @@ class ChatManager:
             bool: True if confirmed, False otherwise
         """
         # Check if auto_confirm is enabled for this tool
-        if server_name and tool_name and self.bot_config.mcp_servers:
-            server_config = mcp_service.get_config(server_name)
-            if server_config and hasattr(server_config, 'auto_confirm') and tool_name in server_config.auto_confirm:
-                if self.verbose:
-                    logger.info(f"Auto-confirming tool use for {server_name}/{tool_name}")
-                return True
+        if tool_name in self._auto_confirm.get(server_name, ()):
+            if self.verbose:
+                logger.info(f"Auto-confirming tool use for {server_name}/{tool_name}")
+            return True
 
         # Otherwise proceed with normal confirmation
         self.display_manager.console.print("\n[yellow]Tool use detected in response:[/yellow]")
         while True:
-            response = input("\nWould you like to proceed with tool execution? (y/n): ").strip().lower()
+            # Awaitable prompt keeps the event loop running and raises Ctrl+C inside this coroutine
+            response = await self.input_manager.get_confirmation("\nWould you like to proceed with tool execution? (y/n): ")
             if response in ['y', 'yes']:
                 return True
             elif response in ['n', 'no']:
                 return False
             self.display_manager.console.print("[yellow]Please answer 'y' or 'n'[/yellow]")
 
+    def _append_message(self, message: Message) -> int:
+        """Append a message to the history and return its index"""
+        self.messages.append(message)
+        index = len(self.messages) - 1
+        if len(self._messages_summary) == index:
+            self._messages_summary.append(f"[{index}] {message.role}")
+        return index
+
+    def get_index_summary(self) -> List[str]:
+        """Get the "[index] role" line for every message in the history"""
+        if len(self._messages_summary) != len(self.messages):
+            # History was replaced (e.g. chat loaded), rebuild once
+            self._messages_summary = [f"[{i}] {msg.role}" for i, msg in enumerate(self.messages)]
+        return self._messages_summary
+
     async def process_user_message(self, user_message: Message):
-        self.messages.append(user_message)
-        self.display_manager.display_message_panel(user_message, index=len(self.messages) - 1)
-        # Store user message content as last output
-        if isinstance(user_message.content, str):
-            self.last_printed_text_output = user_message.content
-        elif isinstance(user_message.content, list):
-             # Assuming user message content list has text part
-            self.last_printed_text_output = next((part.get('text') for part in user_message.content if part.get('type') == 'text'), None)
-
-        assistant_message, external_id = await self.provider.call_chat_completions(self.messages, self.current_chat, self.system_prompt)
-        if external_id:
-            self.external_id = external_id
-        await self.process_assistant_message(assistant_message)
-        await self.persist_chat()
-
-    async def process_assistant_message(self, assistant_message: Message):
-        """Process assistant response and handle tool use recursively"""
+        """Send a user message and keep looping while the assistant requests tools"""
+        current_message = user_message
+        while current_message is not None:
+            self._append_message(current_message)
+            self.display_manager.display_message_panel(current_message, index=len(self.messages) - 1)
+            # Store user message content as last output
+            self.last_printed_text_output = current_message.text
+
+            assistant_message, external_id = await self.provider.call_chat_completions(self.messages, self.current_chat, self.system_prompt)
+            if external_id:
+                self.external_id = external_id
+            current_message = await self.process_assistant_message(assistant_message)
+            if current_message is not None and external_id and not (self.current_chat and self.current_chat.external_id == external_id):
+                # Providers read the conversation ID from current_chat, so store it before the tool follow-up
+                self._persist_dirty.set()
+                await self._flush_persist()
+        self._persist_dirty.set()
+
+    async def process_assistant_message(self, assistant_message: Message) -> Optional[Message]:
+        """Process assistant response and handle tool use
+
+        Returns:
+            Optional[Message]: User message with tool results to send next, or None when the turn is done
+        """
         # Extract content and metadata based on response type
         content = assistant_message.content
 
+        # Fast path for the common case: plain text without any tool tag
+        if isinstance(content, str) and TOOL_SENTINEL not in content:
+            self.last_assistant_index = self._append_message(assistant_message)
+            self.display_manager.display_message_panel(assistant_message, index=self.last_assistant_index)
+            self.last_printed_text_output = content
+            return None
+
         if not contains_tool_use(content):
-            self.messages.append(assistant_message)
+            self.last_assistant_index = self._append_message(assistant_message)
             self.display_manager.display_message_panel(assistant_message, index=len(self.messages) - 1)
             # Store assistant message content as last output
-            if isinstance(content, str):
-                self.last_printed_text_output = content
-            elif isinstance(content, list):
-                self.last_printed_text_output = next((part.get('text') for part in content if part.get('type') == 'text'), None)
-            return
+            self.last_printed_text_output = assistant_message.text
+            return None
 
         # Handle response with tool use
         plain_content, tool_content = split_content(content)
@@ -149,7 +264,7 @@ class ChatManager:
         # Extract MCP tool info before updating content
         mcp_tool = self.mcp_manager.extract_mcp_tool_use(tool_content)
         if not mcp_tool:
-            return
+            return None
         server_name, tool_name, arguments = mcp_tool
         # Add server, tool, and arguments info to assistant message
         assistant_message.server = server_name
@@ -158,29 +273,34 @@ class ChatManager:
 
         # Update last assistant message with plain content
         assistant_message.content = plain_content
-        self.messages.append(assistant_message)
+        assistant_message.__dict__.pop('text', None) # Invalidate cached Message.text
+        self.last_assistant_index = self._append_message(assistant_message)
         self.display_manager.display_message_panel(assistant_message, index=len(self.messages) - 1)
-        if isinstance(plain_content, str):
-             self.last_printed_text_output = plain_content
-        elif isinstance(plain_content, list):
-             self.last_printed_text_output = next((part.get('text') for part in plain_content if part.get('type') == 'text'), None)
-
-        # Get user confirmation for tool execution
-        if not self.get_user_confirmation(tool_content, server_name, tool_name):
-            no_exec_msg = "Tool execution cancelled by user."
-            self.display_manager.console.print(f"\n[yellow]{no_exec_msg}[/yellow]")
-            user_message = create_message("user", no_exec_msg)
-            self.messages.append(user_message)
-            return
-
-        # Execute tool and get results
-        tool_results = await self.mcp_manager.execute_tool(server_name, tool_name, arguments)
+        self.last_printed_text_output = assistant_message.text
+
+        # Reuse a recent result for an identical tool call if caching is enabled
+        cache_ttl = self._get_tool_cache_ttl(server_name)
+        cache_key = self._tool_cache_key(server_name, tool_name, arguments) if cache_ttl > 0 else None
+        tool_results = self._get_cached_tool_result(cache_key, cache_ttl) if cache_key else None
+        if tool_results is not None:
+            if self.verbose:
+                logger.info(f"Using cached result for {server_name}/{tool_name}")
+        else:
+            # Get user confirmation for tool execution
+            if not await self.get_user_confirmation(tool_content, server_name, tool_name):
+                no_exec_msg = "Tool execution cancelled by user."
+                self.display_manager.console.print(f"\n[yellow]{no_exec_msg}[/yellow]")
+                user_message = create_message("user", no_exec_msg)
+                self._append_message(user_message)
+                return None
+
+            # Execute tool and get results
+            tool_results = await self.mcp_manager.execute_tool(server_name, tool_name, arguments)
+            if cache_key:
+                self._store_tool_result(cache_key, tool_results)
 
         # Create user message with tool results and include tool info
-        user_message = create_message("user", tool_results, server=server_name, tool=tool_name, arguments=arguments)
-
-        # Process user message and assistant response recursively
-        await self.process_user_message(user_message)
+        return create_message("user", tool_results, server=server_name, tool=tool_name, arguments=arguments)
 
     async def persist_chat(self):
         """Persist current chat state"""
@@ -191,9 +311,107 @@ class ChatManager:
             # Update existing chat - external_id will be preserved automatically
             self.current_chat = await self.service.update_chat(self.current_chat.id, self.messages, self.external_id)
 
+    async def _persist_loop(self):
+        """Write the chat in the background whenever it is marked dirty, coalescing bursts of changes"""
+        while True:
+            await self._persist_dirty.wait()
+            await asyncio.sleep(_PERSIST_DEBOUNCE)
+            await self._flush_persist()
+
+    async def _flush_persist(self):
+        """Persist the chat now if it has unsaved changes"""
+        async with self._persist_lock:
+            if not self._persist_dirty.is_set():
+                return
+            self._persist_dirty.clear()
+            try:
+                await self.persist_chat()
+            except Exception as e:
+                logger.error(f"Error persisting chat {self.chat_id}: {str(e)}")
+
+    async def _stop_persist_loop(self):
+        """Stop the background writer and flush any pending changes"""
+        if self._persist_task:
+            # Hold the lock so the writer is never cancelled in the middle of a write
+            async with self._persist_lock:
+                self._persist_task.cancel()
+            try:
+                await self._persist_task
+            except asyncio.CancelledError:
+                pass
+            self._persist_task = None
+        await self._flush_persist()
+
+    async def _handle_copy_command(self, command: str):
+        """Copy the last printed output to the clipboard"""
+        await self.input_manager.handle_copy_command(command, self.messages, self.last_printed_text_output, self.get_index_summary)
+
+    async def _handle_translate_command(self, command: str):
+        """Translate the last assistant message and display the result"""
+        content_to_translate = self.input_manager.handle_translate_command(command, self.messages, self.last_assistant_index)
+        # If content_to_translate is None, input_manager already printed an error
+        if not content_to_translate:
+            return
+        # Clear the '/translate' input line
+        self.display_manager.clear_lines(1)
+        # Call the provider's translate method
+        self.display_manager.console.print("[dim]Translating...[/dim]")
+        translated_text = await self.provider.translate_text(content_to_translate, target_language="Chinese")
+        if translated_text:
+            self.display_manager.console.print(f"[blue]Translation:[/blue]\n{translated_text}")
+            self.last_printed_text_output = translated_text # Store translation as last output
+        else:
+            self.display_manager.console.print("[yellow]Translation failed. See console for details.[/yellow]")
+
+    async def _handle_save_command(self, command: str):
+        """Save the conversation"""
+        self.input_manager.handle_save_command(command, self.messages)
+
+    def _load_user_prompts(self) -> str:
+        """Load the configured (non-MCP) prompts from the prompt service"""
+        user_prompts = ""
+        if self.bot_config.prompts:
+            for prompt in self.bot_config.prompts:
+                if prompt not in ["mcp"]:
+                    prompt_config = prompt_service.get_prompt(prompt)
+                    if prompt_config:
+                        user_prompts += prompt_config.content + "\n"
+        return user_prompts
+
+    async def _build_system_prompt(self, user_prompts_task: Optional[asyncio.Task] = None) -> str:
+        """Build the system prompt from the time, MCP and configured prompts.
+
+        Args:
+            user_prompts_task: Optional task already loading the configured prompts
+        """
+        if user_prompts_task is None:
+            user_prompts_task = asyncio.create_task(asyncio.to_thread(self._load_user_prompts))
+
+        system_prompt = ""
+
+        # Add MCP server information
+        if self.bot_config.mcp_servers:
+            server_configs = {}
+            for server_name in self.bot_config.mcp_servers:
+                server_config = mcp_service.get_config(server_name)
+                if server_config:
+                    server_configs[server_name] = server_config.to_dict()
+            mcp_prompt_coro = self.mcp_manager.get_mcp_prompt(self.bot_config.mcp_servers, prompt_service, server_configs)
+            mcp_system_prompt, user_prompts = await asyncio.gather(mcp_prompt_coro, user_prompts_task)
+            if mcp_system_prompt:
+                system_prompt += mcp_system_prompt + "\n"
+        else:
+            user_prompts = await user_prompts_task
+
+        # Add additional prompts to system prompt
+        system_prompt += user_prompts
+
+        return time_prompt + "\n" + system_prompt
+
     async def run(self):
         """Run the chat session"""
         async with AsyncExitStack() as exit_stack:
+            self._persist_task = asyncio.create_task(self._persist_loop())
             try:
                 if self.verbose:
                     logger.info("Starting chat session...")
@@ -210,38 +428,31 @@ class ChatManager:
                 if self.verbose:
                     logger.info("Chat loaded successfully")
 
-                # Init basic system prompt
-                self.system_prompt = time_prompt + "\n"
+                # Load configured prompts in a thread while connecting to MCP servers
+                user_prompts_task = asyncio.create_task(asyncio.to_thread(self._load_user_prompts))
 
-                # Initialize MCP and system prompt if MCP server settings exist
+                # Connect to MCP servers if MCP server settings exist
                 if self.bot_config.mcp_servers:
                     # Connect and get status lists
-                    connected_servers, unconnected_servers = await self.mcp_manager.connect_to_servers(self.bot_config.mcp_servers)
+                    connect_coro = self.mcp_manager.connect_to_servers(self.bot_config.mcp_servers)
+                    # gather retrieves the prompt task's outcome even if connecting fails
+                    (connected_servers, unconnected_servers), _ = await asyncio.gather(connect_coro, user_prompts_task)
 
-                    # Print status summary based on daemon connection and server lists
+                    # Print status summary based on daemon connection and server lists (single write)
+                    status_lines = []
                     if self.mcp_manager.connected_to_daemon:
                         if connected_servers:
-                            self.display_manager.console.print(f"[green]mcp connected:[/green] {', '.join(connected_servers)}")
+                            status_lines.append(f"[green]mcp connected:[/green] {', '.join(connected_servers)}")
                         if unconnected_servers:
-                             self.display_manager.console.print(f"[yellow]mcp not connected:[/yellow] {', '.join(unconnected_servers)}")
-                             self.display_manager.console.print("[yellow](Check MCP daemon status or config)[/yellow]")
+                             status_lines.append(f"[yellow]mcp not connected:[/yellow] {', '.join(unconnected_servers)}")
+                             status_lines.append("[yellow](Check MCP daemon status or config)[/yellow]")
                         elif not connected_servers: # Daemon connected but no configured servers found
-                             self.display_manager.console.print("[yellow]mcp: Daemon connected, but no configured servers found active.[/yellow]")
+                             status_lines.append("[yellow]mcp: Daemon connected, but no configured servers found active.[/yellow]")
                     else:
-                         self.display_manager.console.print("[yellow]mcp: Daemon not running or connection failed.[/yellow]")
-
-                    # Get prompt info (this part remains the same)
-                    mcp_system_prompt = await self.mcp_manager.get_mcp_prompt(self.bot_config.mcp_servers, prompt_service)
-                    if mcp_system_prompt:
-                        self.system_prompt += mcp_system_prompt + "\n"
+                         status_lines.append("[yellow]mcp: Daemon not running or connection failed.[/yellow]")
+                    self.display_manager.console.print("\n".join(status_lines))
 
-                # Add additional prompts to system prompt
-                if self.bot_config.prompts:
-                    for prompt in self.bot_config.prompts:
-                        if prompt not in ["mcp"]:
-                            prompt_config = prompt_service.get_prompt(prompt)
-                            if prompt_config:
-                                self.system_prompt += prompt_config.content + "\n"
+                self.system_prompt = await self._build_system_prompt(user_prompts_task)
 
                 if self.verbose:
                     self.display_manager.display_help()
@@ -267,33 +478,15 @@ class ChatManager:
 
                     # Handle commands
                     if input_type == 'command':
-                        if value == '/copy':
-                            # Pass the last printed output to the handler
-                            self.input_manager.handle_copy_command(value, self.messages, self.last_printed_text_output)
-                        elif value == '/translate':
-                            content_to_translate = self.input_manager.handle_translate_command(value, self.messages)
-                            if content_to_translate:
-                                # Clear the '/translate' input line
-                                self.display_manager.clear_lines(1)
-                                # Call the provider's translate method
-                                self.display_manager.console.print("[dim]Translating...[/dim]")
-                                translated_text = await self.provider.translate_text(content_to_translate, target_language="Chinese")
-                                if translated_text:
-                                    self.display_manager.console.print(f"[blue]Translation:[/blue]\n{translated_text}")
-                                    self.last_printed_text_output = translated_text # Store translation as last output
-                                else:
-                                    self.display_manager.console.print("[yellow]Translation failed. See console for details.[/yellow]")
-                            # If content_to_translate is None, input_manager already printed an error
-                        elif value == '/save':
-                            # Pass the last printed output if save needs it
-                            self.input_manager.handle_save_command(value, self.messages)
-                        # Add other command handlers here if needed
+                        handler = self._command_handlers.get(value)
+                        if handler:
+                            await handler(value)
                         continue # Go back to prompt after handling command
 
                     # Handle legacy copy command (optional, could be removed if /copy is preferred)
                     if value.lower().startswith('copy '):
                          # Pass the last printed output here too if needed, though legacy uses index
-                        if self.input_manager.handle_copy_command(value, self.messages, self.last_printed_text_output):
+                        if await self.input_manager.handle_copy_command(value, self.messages, self.last_printed_text_output, self.get_index_summary):
                             continue
 
                     # Process as regular chat input
@@ -310,9 +503,13 @@ class ChatManager:
                         self.display_manager.clear_lines(1) # Clear the input line
 
                         await self.process_user_message(user_message)
+                        # get_input() blocks the event loop, so write the turn before prompting again
+                        await self._flush_persist()
 
             except (KeyboardInterrupt, EOFError):
                 self.display_manager.console.print("\n[yellow]Chat interrupted. Exiting...[/yellow]")
             finally:
+                # Write any unsaved messages before exiting
+                await self._stop_persist_loop()
                 # Clear sessions on exit
                 self.mcp_manager.clear_sessions()
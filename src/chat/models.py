@@ -1,4 +1,5 @@
 from dataclasses import dataclass, asdict
+from functools import cached_property
 from typing import List, Dict, Optional, Union, Iterable
 from datetime import datetime
 from util import get_iso8601_timestamp
@@ -25,6 +26,24 @@ class Message:
     tool: Optional[str] = None
     arguments: Optional[Dict[str, Union[str, int, float, bool, Dict, List]]] = None
 
+    @cached_property
+    def text(self) -> Optional[str]:
+        """Text of the message: the content string or its first text part.
+
+        Cached on first access; pop 'text' from __dict__ after reassigning content.
+        """
+        content = self.content
+        if isinstance(content, str):
+            return content
+        if isinstance(content, list):
+            for part in content:
+                if isinstance(part, dict):
+                    if part.get('type') == 'text':
+                        return part.get('text')
+                elif getattr(part, 'type', None) == 'text':
+                    return part.text
+        return None
+
     @classmethod
     def from_dict(cls, data: Dict) -> 'Message':
         # Get or generate unix_timestamp
@@ -28,17 +28,13 @@ class DifyProvider(BaseProvider, DisplayManagerMixin):
 
     def _prepare_request_body(self, messages: List[Message], chat: Optional[Chat] = None, system_prompt: Optional[str] = None) -> Dict[str, Any]:
         """Prepare request body for Dify API."""
-        # Get the last user message as query
-        user_messages = [msg for msg in messages if msg.role == "user"]
-        if not user_messages:
+        # Get the last user message as query, scanning back from the end without copying
+        last_user_msg = next((msg for msg in reversed(messages) if msg.role == "user"), None)
+        if last_user_msg is None:
             raise ValueError("No user messages found")
-        
-        last_user_msg = user_messages[-1]
+
         query = last_user_msg.content if isinstance(last_user_msg.content, str) else " ".join(part.text for part in last_user_msg.content)
 
-        # Get conversation history for context
-        conversation_messages = messages[:-1]  # Exclude the last user message
-        
         body = {
             "query": query,
             "response_mode": "streaming",
@@ -1,7 +1,21 @@
+import json
+import orjson
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from chat.models import Chat
 
+def serialize_chat(chat: Chat) -> str:
+    """Serialize a chat to a single JSON line.
+
+    Uses orjson, falling back to the stdlib json module for values orjson
+    rejects (e.g. integers beyond 64 bits in tool arguments).
+    """
+    chat_dict = chat.to_dict()
+    try:
+        return orjson.dumps(chat_dict).decode('utf-8')
+    except TypeError:
+        return json.dumps(chat_dict, ensure_ascii=False)
+
 class ChatRepository(ABC):
     """
     Abstract base class for chat repository implementations.
@@ -6,7 +6,7 @@ from datetime import datetime
 import aiofiles
 from chat.models import Chat, Message
 from config import config
-from . import ChatRepository
+from . import ChatRepository, serialize_chat
 from .cloudflare_client import CloudflareClient
 from loguru import logger
 
@@ -201,7 +201,7 @@ class CloudflareRepository(ChatRepository):
             return
         
         # Write only the modified chats to KV
-        modified_json_lines = [json.dumps(chat.to_dict()) for chat in modified_chats]
+        modified_json_lines = [serialize_chat(chat) for chat in modified_chats]
         modified_str = '\n'.join(modified_json_lines)
         await self.cf_client.kv_put('chats', modified_str)
         # print(f"Wrote {len(modified_chats)} new or modified chats to KV")
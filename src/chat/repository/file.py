@@ -5,7 +5,7 @@ from typing import List, Optional, Dict
 from datetime import datetime
 from chat.models import Chat, Message
 from config import config
-from . import ChatRepository
+from . import ChatRepository, serialize_chat
 
 class FileRepository(ChatRepository):
     def __init__(self):
@@ -35,9 +35,12 @@ class FileRepository(ChatRepository):
     async def _write_chats(self, chats: List[Chat]) -> None:
         """Write all chats to the JSONL file"""
         await self._ensure_file_exists()
-        async with aiofiles.open(self.data_file, 'w', encoding="utf-8") as f:
-            for chat in chats:
-                await f.write(json.dumps(chat.to_dict(), ensure_ascii=False) + '\n')
+        # Serialize everything first so a failure never leaves a truncated file
+        content = ''.join(serialize_chat(chat) + '\n' for chat in chats)
+        tmp_file = self.data_file + '.tmp'
+        async with aiofiles.open(tmp_file, 'w', encoding="utf-8") as f:
+            await f.write(content)
+        os.replace(tmp_file, self.data_file)
 
     async def list_chats(self, keyword: Optional[str] = None, model: Optional[str] = None,
                    provider: Optional[str] = None, limit: int = 10) -> List[Chat]:
@@ -1,13 +1,19 @@
 from typing import Tuple, Optional
 
+TOOL_TAGS = (
+    "use_mcp_tool",
+    "access_mcp_resource"
+)
+# Substring shared by every tool tag; content without it cannot contain tool use
+TOOL_SENTINEL = "_mcp_"
+
 def contains_tool_use(content: str) -> bool:
     """Check if content contains tool use XML tags"""
-    tool_tags = [
-        "use_mcp_tool",
-        "access_mcp_resource"
-    ]
+    # Fast path for plain responses: one C-level substring scan
+    if not isinstance(content, str) or TOOL_SENTINEL not in content:
+        return False
 
-    for tag in tool_tags:
+    for tag in TOOL_TAGS:
         if f"<{tag}>" in content and f"</{tag}>" in content:
             return True
     return False
@@ -21,15 +27,10 @@ def split_content(content: str) -> Tuple[str, Optional[str]]:
     Returns:
         Tuple[str, Optional[str]]: Tuple of (plain content, tool content)
     """
-    tool_tags = [
-        "use_mcp_tool",
-        "access_mcp_resource"
-    ]
-
     # Find the first tool tag
     first_tag_index = len(content)
     first_tag = None
-    for tag in tool_tags:
+    for tag in TOOL_TAGS:
         tag_start = content.find(f"<{tag}>")
         if tag_start != -1 and tag_start < first_tag_index:
             first_tag_index = tag_start
@@ -70,6 +70,9 @@ def mcp_add():
                 break
             auto_confirm.append(tool)
     
+    # Configure tool result caching
+    cache_ttl = click.prompt("Tool result cache TTL in seconds (0 to disable)", type=click.IntRange(min=0), default=0)
+    
     # Save the config
     if service.create_config(
         name=name,
@@ -78,7 +81,8 @@ def mcp_add():
         env=env,
         url=url,
         token=token,
-        auto_confirm=auto_confirm
+        auto_confirm=auto_confirm,
+        cache_ttl=cache_ttl
     ):
         click.echo(f"MCP server '{name}' added successfully")
     else:
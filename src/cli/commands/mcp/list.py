@@ -45,11 +45,12 @@ def mcp_list(verbose: bool = False):
     # Define column width ratios (total should be < 1 to leave space for separators)
     width_ratios = {
         "Name": 0.15,
-        "Type": 0.1,
+        "Type": 0.08,
         "Command/URL": 0.2,
-        "Arguments/Token": 0.2,
+        "Arguments/Token": 0.18,
         "Environment": 0.15,
-        "Auto-Confirm": 0.15
+        "Auto-Confirm": 0.12,
+        "Cache TTL": 0.07
     }
     
     # Calculate actual column widths
@@ -58,7 +59,7 @@ def mcp_list(verbose: bool = False):
     
     # Prepare table data with truncated values
     table_data = []
-    headers = ["Name", "Type", "Command/URL", "Arguments/Token", "Environment", "Auto-Confirm"]
+    headers = ["Name", "Type", "Command/URL", "Arguments/Token", "Environment", "Auto-Confirm", "Cache TTL"]
     
     for config in configs:
         server_type = get_server_type(config)
@@ -77,13 +78,17 @@ def mcp_list(verbose: bool = False):
         # Format auto_confirm list for display
         auto_confirm_str = ', '.join(config.auto_confirm) if config.auto_confirm else ''
         
+        # Format cache TTL for display
+        cache_ttl_str = f"{config.cache_ttl}s" if config.cache_ttl else ''
+        
         table_data.append([
             truncate_text(config.name, col_widths["Name"]),
             server_type,
             truncate_text(command_or_url, col_widths["Command/URL"]),
             truncate_text(args_or_token, col_widths["Arguments/Token"]),
             truncate_text(env_str, col_widths["Environment"]),
-            truncate_text(auto_confirm_str, col_widths["Auto-Confirm"])
+            truncate_text(auto_confirm_str, col_widths["Auto-Confirm"]),
+            cache_ttl_str
         ])
     
     click.echo(tabulate(
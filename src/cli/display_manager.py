@@ -5,7 +5,7 @@ from typing import List, Tuple, Optional
 from chat.models import Message
 from config import config
 from bot.models import BotConfig
-from rich.console import Console
+from rich.console import Console, Group
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.theme import Theme
@@ -28,9 +28,20 @@ class StreamBuffer:
         self.max_chars_per_second = max_chars_per_second
         self.last_update_time = time.time()
         self.last_position = 0
+        self._content_added = asyncio.Event()
 
     def add_content(self, content: str):
         self.buffer += content
+        self._content_added.set()
+
+    async def wait_for_content(self):
+        """Wait until there is undisplayed content in the buffer"""
+        if self.has_remaining:
+            return
+        self._content_added.clear()
+        await self._content_added.wait()
+        # Don't let time spent idle count towards the next chunk's character budget
+        self.last_update_time = time.time()
 
     def get_next_chunk(self) -> str:
         current_time = time.time()
@@ -50,7 +61,8 @@ class StreamBuffer:
 
 class DisplayManager:
     def __init__(self, bot_config: Optional[BotConfig] = None):
-        self.console = Console(theme=custom_theme)
+        # Skip automatic repr highlighting; all styling comes from explicit markup
+        self.console = Console(theme=custom_theme, highlight=False)
         self.max_chars_per_second = bot_config.print_speed if bot_config and bot_config.print_speed else 1000
 
     def display_message_panel(self, message: Message, index: Optional[int] = None):
@@ -60,6 +72,32 @@ class DisplayManager:
             message: The Message object containing role, content, and other attributes
             index: Optional index of the message in the chat history
         """
+        self.console.print(self._build_message_panel(message, index))
+
+    def display_message_panels(self, messages_with_indices: List[Tuple[Message, Optional[int]]], footer: Optional[Panel] = None):
+        """Display several message panels with a single console write.
+
+        Args:
+            messages_with_indices: List of (message, index) pairs to display in order
+            footer: Optional panel to display after the messages in the same write
+        """
+        if not messages_with_indices:
+            return
+        panels = [self._build_message_panel(message, index) for message, index in messages_with_indices]
+        if footer is not None:
+            panels.append(footer)
+        self.console.print(Group(*panels))
+
+    def _build_message_panel(self, message: Message, index: Optional[int] = None) -> Panel:
+        """Build the panel for a message with role-colored borders.
+
+        Args:
+            message: The Message object containing role, content, and other attributes
+            index: Optional index of the message in the chat history
+
+        Returns:
+            Panel: The renderable panel for the message
+        """
         timestamp = f"[timestamp]{message.timestamp}[/timestamp]"
         role = f"[{message.role}]{message.role.capitalize()}[/{message.role}]"
         index_str = f"[{index}] " if index is not None else ""
@@ -72,9 +110,7 @@ class DisplayManager:
             model_info = f" {message.model}{provider}{reasoning}"
 
         # Extract content text from structured content if needed
-        content = message.content
-        if isinstance(content, list):
-            content = next((part.text for part in content if part.type == 'text'), '')
+        content = message.text or ''
 
         # replace <thinking> and </thinking> with thinking emoji
         for tag in ['<thinking>', '</thinking>']:
@@ -106,11 +142,11 @@ class DisplayManager:
             border_style = "tool"  # Use Assistant color for User with MCP info
             model_info = f" {message.tool} @ {message.server}"  # Clear model info for User with MCP info
 
-        self.console.print(Panel(
+        return Panel(
             Markdown(display_content),
             title=f"{index_str}{role} {timestamp}{model_info}",
             border_style=border_style
-        ))
+        )
 
     async def _collect_stream_content(self, response_stream, stream_buffer: StreamBuffer) -> Tuple[str, str]:
         """Collect content from the response stream and add it to the buffer.
@@ -122,8 +158,6 @@ class DisplayManager:
         Returns:
             Tuple[str, str]: A tuple containing (complete response text, reasoning text)
         """
-        all_content = ""
-        all_reasoning_content = ""
         collected_content = []
         collected_reasoning_content = []
         is_reasoning = False
@@ -139,7 +173,6 @@ class DisplayManager:
                     is_reasoning = True
                     new_content += "> reasoning\n"
                 new_content += reasoning_content
-                all_reasoning_content += reasoning_content
                 collected_reasoning_content.append(reasoning_content)
 
             if is_reasoning and not reasoning_content and content:
@@ -148,7 +181,6 @@ class DisplayManager:
 
             if content:
                 new_content += content
-                all_content += content
                 collected_content.append(content)
 
             if new_content:
@@ -199,8 +231,13 @@ class DisplayManager:
                 if chunk:
                     self._update_display_buffer(content_buffer, chunk)
                     live.update("\n".join(content_buffer))
+                elif stream_buffer.has_remaining:
+                    await asyncio.sleep(0.05)  # Rate limited, wait for the next display slot
                 else:
-                    await asyncio.sleep(0.05)  # Small delay only when no content to display
+                    # Idle until the stream pushes new content or finishes
+                    content_waiter = asyncio.ensure_future(stream_buffer.wait_for_content())
+                    await asyncio.wait({collection_task, content_waiter}, return_when=asyncio.FIRST_COMPLETED)
+                    content_waiter.cancel()
 
         # Clear empty line
         self.clear_lines(1)
@@ -235,12 +272,14 @@ class DisplayManager:
         if messages:
             history_messages = [msg for msg in messages if msg.role != 'system']
             if history_messages:
-                for i, message in enumerate(history_messages):
-                    self.display_message_panel(message, index=i)
-                self.console.print(Panel(
-                    "[bold]Type your message to continue the conversation[/bold]",
-                    border_style="yellow"
-                ))
+                # Render the whole history in one write instead of one per message
+                self.display_message_panels(
+                    [(message, i) for i, message in enumerate(history_messages)],
+                    footer=Panel(
+                        "[bold]Type your message to continue the conversation[/bold]",
+                        border_style="yellow"
+                    )
+                )
 
     def print_error(self, error: str, show_traceback: bool = False):
         """Display an error message with optional traceback in a panel"""
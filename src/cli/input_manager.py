@@ -1,7 +1,8 @@
 import sys
+import asyncio
 import pyperclip
-from typing import List, Optional, Tuple, Iterable
-from prompt_toolkit import prompt
+from typing import Callable, List, Optional, Tuple, Iterable
+from prompt_toolkit import PromptSession
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
 from rich.console import Console
@@ -27,8 +28,8 @@ COMMAND_MAP = {
     "exit": "exit", # Allow typing 'exit' directly
     "quit": "exit"  # Allow typing 'quit' directly
 }
-# List of commands/shortcuts that trigger the completer
-COMMAND_TRIGGERS = list(COMMAND_MAP.keys())
+# Set of commands/shortcuts that trigger the completer
+COMMAND_TRIGGERS = frozenset(COMMAND_MAP.keys())
 # --- End Command Definitions ---
 
 class SlashCommandCompleter(Completer):
@@ -38,7 +39,7 @@ class SlashCommandCompleter(Completer):
         self.command_map = command_map
         self.display_text = display_text
         # Get potential inputs (shortcuts and full commands starting with /)
-        self.potential_inputs = [k for k in command_map.keys() if k.startswith('/')]
+        self.potential_inputs = tuple(k for k in command_map.keys() if k.startswith('/'))
 
     def get_completions(self, document: Document, complete_event) -> Iterable[Completion]:
         text = document.text_before_cursor.lower()
@@ -94,6 +95,10 @@ class InputManager:
     def __init__(self, console: Console):
         self.console = console
         self.slash_completer = SlashCommandCompleter(COMMAND_MAP, COMMAND_DISPLAY_TEXT)
+        # Reuse prompt sessions across inputs instead of building one per prompt() call
+        self.session = PromptSession(completer=self.slash_completer, complete_while_typing=True)
+        self._raw_session = PromptSession() # No completer needed for multi-line content
+        self._confirm_session = PromptSession() # Separate history for y/n answers
 
     def get_input(self) -> Tuple[str, str]:
         """Get user input with support for multi-line input and slash commands.
@@ -104,12 +109,7 @@ class InputManager:
                 - value: The user input text or the selected command
         """
         try:
-            text_input = prompt(
-                'Enter: ',
-                completer=self.slash_completer,
-                complete_while_typing=True, # <-- Re-enable this
-                in_thread=True
-            )
+            text_input = self.session.prompt('Enter: ', in_thread=True)
             text_input = text_input.rstrip()
             normalized_text = text_input.lower() # Use lowercase for map lookup
 
@@ -129,7 +129,7 @@ class InputManager:
             if text_input == "<<EOF":
                 lines = []
                 while True:
-                    line = prompt(in_thread=True) # No completer needed for multi-line content
+                    line = self._raw_session.prompt(in_thread=True)
                     if line == "EOF":
                         break
                     lines.extend(line.split("\n"))
@@ -140,6 +140,20 @@ class InputManager:
         except EOFError:
             return ('exit', 'EOF') # Treat Ctrl+D as exit
 
+    async def get_confirmation(self, message: str) -> str:
+        """Prompt for a short answer without blocking the event loop.
+
+        Ctrl+C and Ctrl+D raise KeyboardInterrupt and EOFError in the awaiting coroutine.
+
+        Args:
+            message: The prompt text to display
+
+        Returns:
+            str: The stripped, lowercased answer
+        """
+        response = await self._confirm_session.prompt_async(message)
+        return response.strip().lower()
+
     def _get_last_assistant_message(self, messages: List[Message]) -> Optional[Message]:
         """Find the last message from the assistant."""
         for msg in reversed(messages):
@@ -147,7 +161,12 @@ class InputManager:
                 return msg
         return None
 
-    def handle_copy_command(self, command: str, messages: List[Message], last_printed_text_output: Optional[str]) -> bool:
+    async def _copy_to_clipboard(self, text: str):
+        """Copy text to the clipboard in a thread since pyperclip shells out to the platform tool"""
+        await asyncio.to_thread(pyperclip.copy, text)
+
+    async def handle_copy_command(self, command: str, messages: List[Message], last_printed_text_output: Optional[str],
+                            get_index_summary: Optional[Callable[[], List[str]]] = None) -> bool:
         """Handle the copy command.
         '/copy' copies the last printed text output (message or translation).
         'copy <index>' copies the message by index from history.
@@ -156,6 +175,7 @@ class InputManager:
             command: The copy command (e.g., '/copy' or 'copy 1')
             messages: List of all chat messages (for index-based copy)
             last_printed_text_output: The last text string printed to the console.
+            get_index_summary: Optional callable returning the precomputed "[index] role" lines
 
         Returns:
             bool: True if command was handled, False otherwise
@@ -164,7 +184,7 @@ class InputManager:
         if parts[0] == '/copy' and len(parts) == 1:
             # Use the last printed output if available
             if last_printed_text_output:
-                pyperclip.copy(last_printed_text_output.strip())
+                await self._copy_to_clipboard(last_printed_text_output.strip())
                 self.console.print("[green]Copied last output to clipboard[/green]")
                 return True
             else:
@@ -175,17 +195,16 @@ class InputManager:
             try:
                 msg_idx = int(parts[1])
                 if 0 <= msg_idx < len(messages):
-                    content = messages[msg_idx].content
-                    if isinstance(content, list):
-                        content = next((part['text'] for part in content if part['type'] == 'text'), '')
-                    pyperclip.copy(content.strip())
+                    content = messages[msg_idx].text or ''
+                    await self._copy_to_clipboard(content.strip())
                     self.console.print(f"[green]Copied message [{msg_idx}] to clipboard[/green]")
                 else:
                     # Show available message indices
-                    msg_indices = [f"[{i}] {msg.role}" for i, msg in enumerate(messages)]
-                    self.console.print("[yellow]Invalid message index. Available messages:[/yellow]")
-                    for idx in msg_indices:
-                        self.console.print(idx)
+                    if get_index_summary:
+                        msg_indices = get_index_summary()
+                    else:
+                        msg_indices = [f"[{i}] {msg.role}" for i, msg in enumerate(messages)]
+                    self.console.print("[yellow]Invalid message index. Available messages:[/yellow]\n" + "\n".join(msg_indices))
                 return True
             except (IndexError, ValueError):
                 self.console.print("[yellow]Invalid copy command. Use '/copy' or 'copy <number>'[/yellow]")
@@ -195,21 +214,23 @@ class InputManager:
              self.console.print("[yellow]Invalid copy command format. Use '/copy' or 'copy <number>'[/yellow]")
              return True # Indicate handled to prevent further processing
 
-    def handle_translate_command(self, command: str, messages: List[Message]) -> Optional[str]:
+    def handle_translate_command(self, command: str, messages: List[Message], last_assistant_idx: Optional[int] = None) -> Optional[str]:
         """Handle the translate command. '/translate' finds the last assistant message content.
 
         Args:
             command: The command string ('/translate')
             messages: List of all chat messages
+            last_assistant_idx: Optional index of the last assistant message (avoids scanning messages)
 
         Returns:
             Optional[str]: The content of the last assistant message to be translated, or None if not found.
         """
-        last_assistant_msg = self._get_last_assistant_message(messages)
+        if last_assistant_idx is not None and 0 <= last_assistant_idx < len(messages):
+            last_assistant_msg = messages[last_assistant_idx]
+        else:
+            last_assistant_msg = self._get_last_assistant_message(messages)
         if last_assistant_msg:
-            content_to_translate = last_assistant_msg.content
-            if isinstance(content_to_translate, list):
-                 content_to_translate = next((part['text'] for part in content_to_translate if part['type'] == 'text'), '')
+            content_to_translate = last_assistant_msg.text
             if content_to_translate:
                  return content_to_translate.strip()
             else:
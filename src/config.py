@@ -27,6 +27,7 @@ def get_default_config():
         "openrouter_import_dir": f"{base_dir}/openrouter_import",
         "openrouter_import_history": f"{base_dir}/openrouter_import_history.jsonl",
         "tmp_dir": f"{cache_dir}/tmp",
+        "mcp_catalog_file": f"{cache_dir}/mcp_catalog.json",
         
         # Cloudflare configuration
         "cloudflare": {
@@ -70,7 +71,7 @@ def load_config():
                     config[key] = value
 
     # Set up data files
-    for file_key in ["chat_file", "bot_config_file", "mcp_config_file", "prompt_config_file", "tmp_dir"]:
+    for file_key in ["chat_file", "bot_config_file", "mcp_config_file", "prompt_config_file", "tmp_dir", "mcp_catalog_file"]:
         config[file_key] = os.path.expanduser(config[file_key])
         os.makedirs(os.path.dirname(config[file_key]), exist_ok=True)
 
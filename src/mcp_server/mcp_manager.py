@@ -1,7 +1,9 @@
 import json
 import asyncio
+import hashlib
 import os
 import sys
+import time
 from typing import Dict, List, Optional, Tuple, Any
 from mcp import ClientSession
 from rich.console import Console
@@ -9,13 +11,17 @@ from contextlib import AsyncExitStack
 from daemon_client.main import MCPDaemonClient
 from loguru import logger
 
+# Maximum age (seconds) of a persisted server catalog entry
+CATALOG_MAX_AGE = 24 * 60 * 60
+
 class MCPManager:
-    def __init__(self, console: Console):
+    def __init__(self, console: Console, catalog_file: Optional[str] = None):
         self.sessions: Dict[str, ClientSession] = {}
         self.console = console
         self.client = MCPDaemonClient()
         self.use_daemon = False  # Will be set after checking if daemon is running
         self.connected_to_daemon = False
+        self.catalog_file = catalog_file  # Disk cache of formatted server tool catalogs
 
     async def check_daemon_running(self) -> bool:
         """Check if the MCP daemon is running and update self.connected_to_daemon."""
@@ -189,11 +195,47 @@ class MCPManager:
             logger.debug(f"Error formatting resources for {server_name}: {str(e)}")
             return ""
 
-    async def format_server_info(self, servers) -> str:
+    @staticmethod
+    def _config_hash(server_config: Optional[Dict]) -> Optional[str]:
+        """Hash a server config so catalog entries are invalidated when it changes"""
+        if server_config is None:
+            return None
+        return hashlib.md5(json.dumps(server_config, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _load_catalog(self) -> Dict[str, Dict]:
+        """Load the persisted server catalog, ignoring missing or corrupt files"""
+        if not self.catalog_file or not os.path.exists(self.catalog_file):
+            return {}
+        try:
+            with open(self.catalog_file, "r", encoding="utf-8") as f:
+                catalog = json.load(f)
+            return catalog if isinstance(catalog, dict) else {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.debug(f"Error loading MCP catalog cache: {str(e)}")
+            return {}
+
+    def _save_catalog(self, catalog: Dict[str, Dict]):
+        """Persist the server catalog"""
+        if not self.catalog_file:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.catalog_file), exist_ok=True)
+            with open(self.catalog_file, "w", encoding="utf-8") as f:
+                json.dump(catalog, f, ensure_ascii=False)
+        except OSError as e:
+            logger.debug(f"Error saving MCP catalog cache: {str(e)}")
+
+    async def format_server_info(self, servers, server_configs: Optional[Dict[str, Dict]] = None) -> str:
         """
         Format MCP server information for the system prompt.
         Works with both direct connections and daemon-based connections.
-        
+
+        Args:
+            servers: Names of the servers to include
+            server_configs: Optional mapping of server name to config dict; servers with a
+                config that the daemon currently lists are served from (and saved to) the
+                catalog cache file
+
         Returns:
             Formatted server information string
         """
@@ -204,8 +246,21 @@ class MCPManager:
             
         # Format server information from daemon
         server_sections = []
-        
+        server_configs = server_configs or {}
+        catalog = self._load_catalog()
+        catalog_changed = False
+
         for server_name in servers:
+            # Reuse the cached section if the server is up and its config is unchanged
+            config_hash = None
+            if server_name in server_names:
+                config_hash = self._config_hash(server_configs.get(server_name))
+            cached = catalog.get(server_name)
+            if (config_hash and cached and cached.get("config_hash") == config_hash
+                    and time.time() - cached.get("cached_at", 0) < CATALOG_MAX_AGE):
+                server_sections.append(cached["section"])
+                continue
+
             # Gather all sections for this server
             tools_section = await self._format_tools_section(server_name)
             templates_section = await self._format_templates_section(server_name)
@@ -219,20 +274,33 @@ class MCPManager:
                 f"{resources_section}"
             )
             server_sections.append(server_section)
-        
+
+            # Only cache servers that actually reported something
+            if config_hash and (tools_section or templates_section or resources_section):
+                catalog[server_name] = {
+                    "config_hash": config_hash,
+                    "cached_at": time.time(),
+                    "section": server_section
+                }
+                catalog_changed = True
+
+        if catalog_changed:
+            self._save_catalog(catalog)
+
         return "\n\n".join(server_sections)
     
-    async def get_mcp_prompt(self, servers, prompt_service) -> str:
+    async def get_mcp_prompt(self, servers, prompt_service, server_configs: Optional[Dict[str, Dict]] = None) -> str:
         """Generate the complete system prompt including MCP server information
         
         Args:
             prompt_service: Prompt service instance for retrieving the MCP prompt template
+            server_configs: Optional mapping of server name to config dict used for catalog caching
             
         Returns:
             Formatted MCP prompt string or None if no servers connected
         """
         # Get formatted server information
-        server_info = await self.format_server_info(servers)
+        server_info = await self.format_server_info(servers, server_configs)
         if server_info:
             mcp_prompt = prompt_service.get_prompt("mcp")
             if mcp_prompt:
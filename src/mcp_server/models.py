@@ -14,6 +14,7 @@ class McpServerConfig:
         url (str, optional): The URL endpoint for SSE server connection
         token (str, optional): The authentication token for SSE server connection
         auto_confirm (list[str], optional): List of tool names that should be auto-confirmed without user prompt
+        cache_ttl (int, optional): Seconds to reuse results of identical tool calls within a chat session (0 disables caching)
     """
     
     name: str
@@ -23,6 +24,7 @@ class McpServerConfig:
     url: Optional[str] = None
     token: Optional[str] = None
     auto_confirm: List[str] = field(default_factory=list)
+    cache_ttl: int = 0
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'McpServerConfig':
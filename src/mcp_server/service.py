@@ -64,7 +64,8 @@ class McpServerConfigService:
         env: Optional[dict[str, str]] = None,
         url: Optional[str] = None,
         token: Optional[str] = None,
-        auto_confirm: Optional[List[str]] = None
+        auto_confirm: Optional[List[str]] = None,
+        cache_ttl: int = 0
     ) -> bool:
         """
         Create a new MCP setting
@@ -77,6 +78,7 @@ class McpServerConfigService:
             url (str, optional): The URL endpoint for server connection (for SSE)
             token (str, optional): The authentication token (for SSE)
             auto_confirm (List[str], optional): List of tool names that should be auto-confirmed
+            cache_ttl (int, optional): Seconds to reuse identical tool call results (0 disables caching)
             
         Returns:
             bool: True if creation was successful, False otherwise
@@ -88,7 +90,8 @@ class McpServerConfigService:
             env=env or {}, 
             url=url, 
             token=token,
-            auto_confirm=auto_confirm or []
+            auto_confirm=auto_confirm or [],
+            cache_ttl=cache_ttl
         )
         return self.repository.add_or_update(setting)
         